@@ -0,0 +1,57 @@
+"""MigraDB GUI package.
+
+Public classes are resolved lazily on first attribute access (PEP 562), so a
+bare ``import migradb_gui`` does not pull in PySide6, SQLAlchemy, pydantic or
+rich.
+"""
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import TYPE_CHECKING, Any, Dict, Tuple
+
+if TYPE_CHECKING:
+    from migradb_gui.app import MainWindow
+    from migradb_gui.connection import ConnectionDialog, ConnectionPair, PgConnection
+    from migradb_gui.explorer import SchemaExplorer
+    from migradb_gui.home import HomeWidget
+    from migradb_gui.mapper import MappingDialog
+    from migradb_gui.migration import MigrationExecutor, MigrationSettings
+    from migradb_gui.runner import RunnerDialog
+    from migradb_gui.schema import ColumnInfo, SchemaInspector, TableInfo
+    from migradb_gui.transform_editor import TransformEditorDialog
+
+# public name -> (module, attribute)
+_LAZY_IMPORTS: Dict[str, Tuple[str, str]] = {
+    "MainWindow": ("migradb_gui.app", "MainWindow"),
+    "ConnectionDialog": ("migradb_gui.connection", "ConnectionDialog"),
+    "ConnectionPair": ("migradb_gui.connection", "ConnectionPair"),
+    "PgConnection": ("migradb_gui.connection", "PgConnection"),
+    "SchemaExplorer": ("migradb_gui.explorer", "SchemaExplorer"),
+    "HomeWidget": ("migradb_gui.home", "HomeWidget"),
+    "MappingDialog": ("migradb_gui.mapper", "MappingDialog"),
+    "MigrationExecutor": ("migradb_gui.migration", "MigrationExecutor"),
+    "MigrationSettings": ("migradb_gui.migration", "MigrationSettings"),
+    "RunnerDialog": ("migradb_gui.runner", "RunnerDialog"),
+    "ColumnInfo": ("migradb_gui.schema", "ColumnInfo"),
+    "SchemaInspector": ("migradb_gui.schema", "SchemaInspector"),
+    "TableInfo": ("migradb_gui.schema", "TableInfo"),
+    "TransformEditorDialog": ("migradb_gui.transform_editor", "TransformEditorDialog"),
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        mod_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    val = getattr(importlib.import_module(mod_name), attr)
+    # cache on the module so later lookups skip __getattr__
+    setattr(sys.modules[__name__], name, val)
+    return val
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
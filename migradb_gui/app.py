@@ -6,39 +6,53 @@ explorer, etc.) will be added in subsequent iterations.
 """
 from __future__ import annotations
 
+import importlib
 import sys
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Slot
 from PySide6.QtWidgets import (
     QApplication,
-    QLabel,
     QMainWindow,
     QStatusBar,
-    QMenu,
-    QMenuBar,
     QMessageBox,
     QDialog,
 )
 
-from migradb_gui.connection import ConnectionDialog, ConnectionPair
-from migradb_gui.home import HomeWidget
+if TYPE_CHECKING:
+    from migradb_gui.connection import ConnectionPair
 
 APP_NAME = "MigraDB GUI"
 
+# modules behind the first user click; imported in the background after the
+# window is shown so pydantic/SQLAlchemy load off the critical path
+_PREWARM_MODULES = (
+    "migradb_gui.connection",
+    "migradb_gui.explorer",
+    "migradb_gui.migration",
+    "migradb_gui.mapper",
+    "migradb_gui.runner",
+    "migradb_gui.schema",
+)
+
 
 class MainWindow(QMainWindow):
     """Main application window."""
 
+    @Slot()
     def _open_transform_editor(self) -> None:  # noqa: D401
         from migradb_gui.transform_editor import TransformEditorDialog
 
         dlg = TransformEditorDialog(self)
         dlg.exec()
 
+    @Slot()
     def _open_connections(self) -> None:
         """Open the connection dialog and store validated connections."""
+        from migradb_gui.connection import ConnectionDialog
+
         dlg = ConnectionDialog(self)
         if dlg.exec() == QDialog.Accepted:
             pair = dlg.pair
@@ -67,6 +81,8 @@ class MainWindow(QMainWindow):
         self.resize(900, 700)
 
         # Home landing widget
+        from migradb_gui.home import HomeWidget
+
         home = HomeWidget()
         home.start_migration_requested.connect(self._open_connections)
         self.setCentralWidget(home)
@@ -89,6 +105,16 @@ class MainWindow(QMainWindow):
         edit_action.triggered.connect(self._open_transform_editor)
 
 
+def _prewarm() -> None:
+    """Import :data:`_PREWARM_MODULES` on a daemon thread."""
+
+    def _import_all() -> None:
+        for name in _PREWARM_MODULES:
+            importlib.import_module(name)
+
+    threading.Thread(target=_import_all, name="prewarm", daemon=True).start()
+
+
 def run(argv: Optional[list[str]] | None = None) -> None:  # pragma: no cover
     """Run the application.
 
@@ -101,6 +127,9 @@ def run(argv: Optional[list[str]] | None = None) -> None:  # pragma: no cover
 
     window = MainWindow()
     window.show()
+    # paint the window before the prewarm thread starts competing for the GIL
+    QApplication.processEvents()
+    _prewarm()
 
     sys.exit(app.exec())
 
@@ -1,7 +1,8 @@
 """Connection dialog and models for MigraDB GUI.
 
 This module provides:
-* `PgConnection`: a pydantic model holding PostgreSQL connection info.
+* `PgConnection`: a dataclass holding PostgreSQL connection info (validated
+  through a lazily built pydantic model).
 * `ConnectionDialog`: a `QDialog` that lets the user enter connection details
   for *source* (old) and *target* (new) databases, test them, and emit the
   validated connection pair.
@@ -11,11 +12,11 @@ config file will be added later.
 """
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+import functools
+from dataclasses import asdict, dataclass, field
 from typing import Tuple
 
-from pydantic import BaseModel, Field, SecretStr, ValidationError, field_validator
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, Slot
 from PySide6.QtGui import QAction
 from PySide6.QtWidgets import (
     QDialog,
@@ -34,31 +35,48 @@ from PySide6.QtWidgets import (
 )
 
 
-class PgConnection(BaseModel):
+@dataclass(kw_only=True)
+class PgConnection:
     """PostgreSQL connection parameters."""
 
-    host: str = Field(..., description="Hostname or IP address")
-    port: int = Field(5432, description="TCP port")
-    database: str = Field(..., description="Database name")
-    user: str = Field(..., description="Username")
-    password: SecretStr = Field(..., description="Password")
+    host: str
+    port: int = 5432
+    database: str
+    user: str
+    password: str = field(repr=False)
 
-    @field_validator("host")
-    @classmethod
-    def non_empty(cls, v: str) -> str:  # noqa: D401, N805
-        if not v:
-            raise ValueError("host cannot be empty")
-        return v
+    _url: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def sqlalchemy_url(self) -> str:
-        """Return a postgres+psycopg2 URL string."""
-        return (
-            f"postgresql+psycopg2://{self.user}:{self.password.get_secret_value()}"
-            f"@{self.host}:{self.port}/{self.database}"
-        )
+        """Return a postgres+psycopg2 URL string (built once per instance)."""
+        if self._url is None:
+            self._url = (
+                f"postgresql+psycopg2://{self.user}:{self.password}"
+                f"@{self.host}:{self.port}/{self.database}"
+            )
+        return self._url
+
+
+@functools.lru_cache(maxsize=1)
+def _get_pg_model() -> type:
+    """Return the pydantic model validating form input, built on first use.
 
+    Importing pydantic and compiling the model schema is deferred until the
+    user first submits the connection dialog.
+    """
+    from pydantic import BaseModel, Field, SecretStr
 
-@dataclass
+    class _PgConnectionModel(BaseModel):
+        host: str = Field(..., description="Hostname or IP address")
+        port: int = Field(5432, description="TCP port")
+        database: str = Field(..., description="Database name")
+        user: str = Field(..., description="Username")
+        password: SecretStr = Field(..., description="Password")
+
+    return _PgConnectionModel
+
+
+@dataclass(slots=True)
 class ConnectionPair:
     """Pair of source and target connections."""
 
@@ -89,17 +107,28 @@ class _PgForm(QWidget):
         self.setLayout(layout)
 
     def to_connection(self) -> PgConnection | None:
+        host = self.host_edit.text().strip()
         try:
-            return PgConnection(
-                host=self.host_edit.text().strip(),
+            if not host:
+                raise ValueError("host cannot be empty")
+            # pydantic's ValidationError is a ValueError subclass
+            model = _get_pg_model()(
+                host=host,
                 port=int(self.port_edit.text().strip() or 5432),
                 database=self.db_edit.text().strip(),
                 user=self.user_edit.text().strip(),
                 password=self.pwd_edit.text(),
             )
-        except (ValidationError, ValueError) as exc:
+        except ValueError as exc:
             QMessageBox.critical(self, self._title, str(exc))
             return None
+        return PgConnection(
+            host=model.host,
+            port=model.port,
+            database=model.database,
+            user=model.user,
+            password=model.password.get_secret_value(),
+        )
 
 
 class ConnectionDialog(QDialog):
@@ -143,6 +172,7 @@ class ConnectionDialog(QDialog):
     def pair(self) -> ConnectionPair | None:  # noqa: D401
         return self._pair
 
+    @Slot()
     def _on_accept(self) -> None:  # noqa: D401
         source = self.source_form.to_connection()
         if not source:
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from typing import Dict, List, Tuple
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Slot
 from PySide6.QtGui import QBrush, QColor
 from PySide6.QtWidgets import (
     QDockWidget,
@@ -39,7 +39,6 @@ class SchemaExplorer(QDockWidget):
 
         self.tree = QTreeWidget()
         self.tree.setHeaderLabels(["Table / Column", "Type", "Notes"])
-        self.tree.setColumnWidth(0, 200)
 
         run_btn = QPushButton("Run Migration")
         run_btn.clicked.connect(self._on_run)
@@ -66,6 +65,7 @@ class SchemaExplorer(QDockWidget):
     # slots
     # ------------------------------------------------------------------
 
+    @Slot()
     def _on_run(self) -> None:  # noqa: D401
         uuid_tables = {self.tree.topLevelItem(i).text(0)
                        for i in range(self.tree.topLevelItemCount())
@@ -73,6 +73,7 @@ class SchemaExplorer(QDockWidget):
         dlg = RunnerDialog(self._pair, uuid_tables, self._column_maps, self)
         dlg.exec()
 
+    @Slot(QTreeWidgetItem, int)
     def _on_double_click(self, item: QTreeWidgetItem, col: int) -> None:  # noqa: D401
         # only allow mapping for table-level items (no parent)
         if item.parent() is not None:
@@ -90,19 +91,20 @@ class SchemaExplorer(QDockWidget):
     # ------------------------------------------------------------------
 
     def _load_schemas(self) -> None:  # noqa: D401
-        self.tree.clear()
-
         src = SchemaInspector(self._pair.source.sqlalchemy_url())
         tgt = SchemaInspector(self._pair.target.sqlalchemy_url())
 
         src_tables = {t.name: t for t in src.list_tables()}
         tgt_tables = {t.name: t for t in tgt.list_tables()}
 
+        # build the whole tree detached from the view, then insert it at once
+        top_items: List[QTreeWidgetItem] = []
         table_names = sorted(set(src_tables) | set(tgt_tables))
         for name in table_names:
             src_tbl = src_tables.get(name)
             tgt_tbl = tgt_tables.get(name)
-            root_item = QTreeWidgetItem(self.tree, [name])
+            root_item = QTreeWidgetItem([name])
+            top_items.append(root_item)
 
             if src_tbl and tgt_tbl:
                 self._populate_table(root_item, src_tbl, tgt_tbl)
@@ -115,14 +117,21 @@ class SchemaExplorer(QDockWidget):
                 root_item.setText(2, "Missing in source")
                 self._populate_columns_only(root_item, tgt_tbl)
 
+        self.tree.setUpdatesEnabled(False)
+        self.tree.blockSignals(True)
+        try:
+            self.tree.clear()
+            self.tree.addTopLevelItems(top_items)
+        finally:
+            self.tree.blockSignals(False)
+            self.tree.setUpdatesEnabled(True)
+        self.tree.setColumnWidth(0, 200)
+
     def _populate_columns_only(self, parent: QTreeWidgetItem, tbl: TableInfo) -> None:
-        for col in tbl.columns:
-            QTreeWidgetItem(parent, [f"{col.name}", col.data_type])
+        parent.addChildren([QTreeWidgetItem([f"{col.name}", col.data_type]) for col in tbl.columns])
 
     def _populate_table(self, parent: QTreeWidgetItem, src_tbl: TableInfo, tgt_tbl: TableInfo) -> None:
-        src_pk = src_tbl.primary_keys[0] if src_tbl.primary_keys else None
-        tgt_pk = tgt_tbl.primary_keys[0] if tgt_tbl.primary_keys else None
-        needs_uuid_conv = src_pk and tgt_pk and src_pk.is_incremental_pk() and tgt_pk.is_uuid_pk()
+        needs_uuid_conv = src_tbl.has_incremental_pk() and tgt_tbl.has_uuid_pk()
 
         if needs_uuid_conv:
             parent.setCheckState(0, Qt.CheckState.Checked)
@@ -131,14 +140,14 @@ class SchemaExplorer(QDockWidget):
         else:
             parent.setCheckState(0, Qt.CheckState.Unchecked)
 
-        col_names = {c.name for c in src_tbl.columns} | {
-            c.name for c in tgt_tbl.columns}
-        for col_name in sorted(col_names):
-            src_col = next(
-                (c for c in src_tbl.columns if c.name == col_name), None)
-            tgt_col = next(
-                (c for c in tgt_tbl.columns if c.name == col_name), None)
-            item = QTreeWidgetItem(parent, [col_name])
+        src_by_name = {c.name: c for c in src_tbl.columns}
+        tgt_by_name = {c.name: c for c in tgt_tbl.columns}
+        children: List[QTreeWidgetItem] = []
+        for col_name in sorted(src_by_name.keys() | tgt_by_name.keys()):
+            src_col = src_by_name.get(col_name)
+            tgt_col = tgt_by_name.get(col_name)
+            item = QTreeWidgetItem([col_name])
+            children.append(item)
             if src_col and tgt_col:
                 type_str = f"{src_col.data_type} → {tgt_col.data_type}" if src_col.data_type != tgt_col.data_type else src_col.data_type
                 item.setText(1, type_str)
@@ -150,3 +159,4 @@ class SchemaExplorer(QDockWidget):
             elif tgt_col:
                 item.setText(1, tgt_col.data_type)
                 item.setText(2, "Missing in source")
+        parent.addChildren(children)
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from typing import Dict, List
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Slot
 from PySide6.QtWidgets import (
     QComboBox,
     QDialog,
@@ -34,8 +34,6 @@ class MappingDialog(QDialog):
         self._pair = pair
         self._combos: Dict[str, QComboBox] = {}
 
-        src_cols = {c.name for c in SchemaInspector(pair.source.sqlalchemy_url()).list_tables() if c.name == table_name}.pop()
-
         # get columns lists
         src_inspector = SchemaInspector(pair.source.sqlalchemy_url())
         tgt_inspector = SchemaInspector(pair.target.sqlalchemy_url())
@@ -67,6 +65,7 @@ class MappingDialog(QDialog):
 
     # ------------------------------------------------------------------
 
+    @Slot()
     def _on_accept(self) -> None:
         mapping: Dict[str, str] = {}
         for tgt, combo in self._combos.items():
@@ -2,41 +2,168 @@
 
 This module performs the core migration steps:
 
-* Builds dependency order between tables (topological sort on FK graph).
+* Builds dependency order between tables (topological sort on FK graph),
+  grouped into layers of mutually independent tables that can optionally be
+  migrated concurrently.
 * For tables flagged for *UUID conversion*, generates new UUID primary keys and
   tracks an in-memory mapping old_id → new_uuid so child tables can remap
   foreign keys.
 * Copies data in batches, wrapped in a single transaction (per run) so errors
   trigger rollback.
+* Tables that need no rewriting are streamed PostgreSQL → PostgreSQL with
+  binary ``COPY`` instead of going through Python row objects.
 * Emits progress events via an optional callback to update GUI progress bars.
 * Uses *rich* logging for colorful console logging.
 """
 from __future__ import annotations
 
+import csv
+import datetime
+import functools
+import io
 import logging
+import os
+import threading
 import uuid
-from collections import defaultdict, deque
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Set, Tuple
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Set, Tuple
 
-from rich.logging import RichHandler
-from sqlalchemy import MetaData, Table, create_engine, select, func
+from sqlalchemy import MetaData, Table, create_engine, func, literal, select, text, union_all
 from sqlalchemy.engine import Connection, Engine
-from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.exc import CompileError, SQLAlchemyError
 
 from importlib import import_module
 
 from migradb_gui.connection import ConnectionPair
 
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
-logger.addHandler(RichHandler(markup=True))
+_rich_attached = False
 
 ProgressCallback = Callable[[str, int, int], None]
 
-
-@dataclass
+# Python value types each raw insert method can send without SQLAlchemy's
+# bind processing (JSON/HSTORE dicts, for instance, need it)
+_CSV_TYPES = (str, int, float, Decimal, bool, uuid.UUID, datetime.date, datetime.time)
+_VALUES_TYPES = _CSV_TYPES + (bytes, list, datetime.timedelta)
+
+
+def _ensure_rich_logger() -> None:
+    """Attach the *rich* console handler on first use rather than at import."""
+    global _rich_attached
+    if not _rich_attached:
+        from rich.logging import RichHandler
+
+        logger.addHandler(RichHandler(markup=True))
+        _rich_attached = True
+
+
+# byte translation tables stamping the RFC 4122 version (4) and variant bits
+_UUID_VERSION_4 = bytes((b & 0x0F) | 0x40 for b in range(256))
+_UUID_VARIANT = bytes((b & 0x3F) | 0x80 for b in range(256))
+
+
+def _uuid4_batch(n: int) -> List[uuid.UUID]:
+    """Return *n* random version-4 UUIDs drawn from a single ``os.urandom`` call."""
+    raw = bytearray(os.urandom(16 * n))
+    raw[6::16] = raw[6::16].translate(_UUID_VERSION_4)
+    raw[8::16] = raw[8::16].translate(_UUID_VARIANT)
+    buf = bytes(raw)
+    return [uuid.UUID(bytes=buf[i:i + 16]) for i in range(0, len(buf), 16)]
+
+
+def _count_rows(sess: Session, tables: List[Table], chunk: int = 200) -> Dict[str, int]:
+    """Return exact row counts for *tables* using ``UNION ALL`` count queries."""
+    counts: Dict[str, int] = {}
+    for i in range(0, len(tables), chunk):
+        query = union_all(*(
+            select(literal(t.name).label("tbl"), func.count().label("n")).select_from(t)
+            for t in tables[i:i + chunk]
+        ))
+        counts.update(sess.execute(query).all())
+    return counts
+
+
+def _split_per_row(
+    split_fn: Callable[[Dict[str, Any]], Dict[str, List[Dict[str, Any]]]],
+    rows: List[Dict[str, Any]],
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Adapt a per-row ``split_<table>`` hook to the batch contract."""
+    out: Dict[str, List[Dict[str, Any]]] = {}
+    for row in rows:
+        for tgt_name, tgt_rows in split_fn(row).items():
+            out.setdefault(tgt_name, []).extend(tgt_rows)
+    return out
+
+
+def _csv_buffer(rows: List[Any]) -> io.StringIO:
+    """Return *rows* as a CSV buffer for ``COPY ... FROM STDIN WITH CSV``."""
+    # QUOTE_NOTNULL keeps NULL (unquoted empty) distinct from '' (quoted)
+    buf = io.StringIO()
+    csv.writer(buf, quoting=csv.QUOTE_NOTNULL).writerows(rows)
+    buf.seek(0)
+    return buf
+
+
+class _IdMap:
+    """Old integer PK → new UUID map for one UUID-converted table.
+
+    Entries live in two flat buffers (an ``int64`` array and 16 bytes per
+    UUID) instead of a dict of int/UUID objects; lookups bisect the sorted
+    prefix of the ids. Ids added out of order while the table is still being
+    copied are indexed in a small dict until :meth:`freeze` sorts them in.
+    """
+
+    __slots__ = ("_ids", "_uuids", "_n_sorted", "_tail")
+
+    def __init__(self) -> None:
+        self._ids = array("q")
+        self._uuids = bytearray()
+        self._n_sorted = 0  # self._ids[:_n_sorted] is ascending
+        self._tail: Dict[int, int] = {}  # old id -> buffer index, past the prefix
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, old_id: int, new_uuid: uuid.UUID) -> None:
+        n = len(self._ids)
+        if n == self._n_sorted and (not n or old_id > self._ids[-1]):
+            self._n_sorted += 1
+        else:
+            self._tail[old_id] = n
+        self._ids.append(old_id)
+        self._uuids += new_uuid.bytes
+
+    def freeze(self) -> None:
+        """Sort entries by old id; called once the owning table is copied."""
+        if not self._tail:
+            return
+        order = sorted(range(len(self._ids)), key=self._ids.__getitem__)
+        uuids = self._uuids
+        self._ids = array("q", (self._ids[i] for i in order))
+        self._uuids = bytearray(b"".join(uuids[16 * i:16 * i + 16] for i in order))
+        self._n_sorted = len(self._ids)
+        self._tail = {}
+
+    def get(self, old_id: int) -> uuid.UUID | None:
+        i = bisect_left(self._ids, old_id, 0, self._n_sorted)
+        if not (i < self._n_sorted and self._ids[i] == old_id):
+            # self-referencing FK while the table is still copying
+            i = self._tail.get(old_id)
+            if i is None:
+                return None
+        return uuid.UUID(bytes=bytes(self._uuids[16 * i:16 * i + 16]))
+
+
+@dataclass(slots=True)
 class MigrationSettings:
     """User choices for the migration run."""
 
@@ -45,6 +172,13 @@ class MigrationSettings:
     column_maps: Dict[str, Dict[str, str]]
     batch_size: int = 1000
     validate: bool = True
+    # how the batched path writes rows on PostgreSQL targets: "executemany"
+    # (SQLAlchemy insert), "values" (psycopg2 execute_values) or "copy"
+    # (COPY FROM STDIN CSV); tables with unsupported column types fall back
+    insert_method: str = "executemany"
+    # >1 migrates independent tables of a dependency layer concurrently; each
+    # table then commits in its own transaction instead of one per run
+    max_workers: int = 1
 
 
 class MigrationExecutor:
@@ -55,43 +189,74 @@ class MigrationExecutor:
         pair: ConnectionPair,
         settings: MigrationSettings,
         progress_cb: ProgressCallback | None = None,
+        src_meta: MetaData | None = None,
+        tgt_meta: MetaData | None = None,
     ) -> None:
+        """Create engines for *pair*.
+
+        Already-reflected *src_meta*/*tgt_meta* (see
+        :func:`migradb_gui.schema.reflect_metadata`) are used as-is; otherwise
+        both databases are reflected here.
+        """
         self._pair = pair
         self._settings = settings
         self._progress_cb = progress_cb or (lambda *_: None)
 
         self._src_engine: Engine = create_engine(
             pair.source.sqlalchemy_url(), future=True)
+        # executemany inserts are sent as multi-row INSERT ... VALUES pages
+        # (SQLAlchemy's insertmanyvalues); one page per batch means one round
+        # trip per batch rather than several of the default 1000 rows
         self._tgt_engine: Engine = create_engine(
-            pair.target.sqlalchemy_url(), future=True)
-
-        self._src_meta = MetaData()
-        self._tgt_meta = MetaData()
+            pair.target.sqlalchemy_url(), future=True,
+            insertmanyvalues_page_size=settings.batch_size)
 
         # optional transforms module
         try:
             self._transforms = import_module("migradb_gui.transforms")
         except ModuleNotFoundError:
             self._transforms = None
-        self._src_meta.reflect(bind=self._src_engine)
-        self._tgt_meta.reflect(bind=self._tgt_engine)
 
-        self._id_maps: Dict[str, Dict[int, uuid.UUID]] = defaultdict(dict)
+        if src_meta is None:
+            src_meta = MetaData()
+            src_meta.reflect(bind=self._src_engine)
+        if tgt_meta is None:
+            tgt_meta = MetaData()
+            tgt_meta.reflect(bind=self._tgt_engine)
+        self._src_meta = src_meta
+        self._tgt_meta = tgt_meta
+
+        self._id_maps: Dict[str, _IdMap] = defaultdict(_IdMap)
+        self._id_maps_lock = threading.Lock()
+        # tables copied 1:1, whose row counts are checked at the end of the run,
+        # and tables split hooks wrote to, whose counts no longer match
+        self._copied_tables: List[str] = []
+        self._split_targets: Set[str] = set()
 
     # ------------------------------------------------------------------
     # public API
     # ------------------------------------------------------------------
 
     def run(self) -> None:  # noqa: D401
+        _ensure_rich_logger()
+        from sqlalchemy.orm import Session
+
         logger.info("[bold cyan]Starting migration[/bold cyan]")
-        order = self._determine_order()
-        logger.info("Dependency order: %s", order)
+        layers = self._determine_order()
+        logger.info("Dependency order: %s", layers)
+
+        if self._settings.max_workers > 1:
+            self._run_parallel(layers)
+            return
 
         with Session(self._tgt_engine) as tgt_sess, Session(self._src_engine) as src_sess:
             try:
                 tgt_sess.begin()
-                for tbl_name in order:
-                    self._migrate_table(src_sess, tgt_sess, tbl_name)
+                for layer in layers:
+                    for tbl_name in layer:
+                        self._migrate_table(src_sess, tgt_sess, tbl_name)
+                if self._settings.validate:
+                    self._validate_counts(src_sess, tgt_sess)
                 tgt_sess.commit()
                 logger.info("[bold green]Migration successful[/bold green]")
             except Exception:
@@ -103,98 +268,182 @@ class MigrationExecutor:
     # internal helpers
     # ------------------------------------------------------------------
 
-    def _determine_order(self) -> List[str]:  # noqa: D401
-        """Topologically sort tables based on FK dependencies."""
-        graph: Dict[str, Set[str]] = defaultdict(set)
+    def _run_parallel(self, layers: List[List[str]]) -> None:
+        """Migrate each layer's tables on a thread pool, layer by layer.
+
+        Sessions are not thread-safe, so every table gets its own source and
+        target session and commits on success. A failure rolls back only that
+        table; tables already committed stay in the target.
+        """
+        try:
+            for layer in layers:
+                workers = min(self._settings.max_workers, len(layer))
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="migrate") as pool:
+                    list(pool.map(self._migrate_table_isolated, layer))
+        except Exception:
+            logger.exception("Migration failed – rolled back the failing table")
+            raise
+        if self._settings.validate:
+            from sqlalchemy.orm import Session
+
+            try:
+                with Session(self._tgt_engine) as tgt_sess, Session(self._src_engine) as src_sess:
+                    self._validate_counts(src_sess, tgt_sess)
+            except Exception:
+                logger.exception("Validation failed – all tables are already committed")
+                raise
+        logger.info("[bold green]Migration successful[/bold green]")
+
+    def _migrate_table_isolated(self, tbl_name: str) -> None:
+        from sqlalchemy.orm import Session
+
+        with Session(self._tgt_engine) as tgt_sess, Session(self._src_engine) as src_sess:
+            with tgt_sess.begin():
+                self._migrate_table(src_sess, tgt_sess, tbl_name)
+
+    def _determine_order(self) -> List[List[str]]:  # noqa: D401
+        """Group tables into FK dependency layers, parents before children.
+
+        Builds on SQLAlchemy's topological ``sorted_tables``: a table's layer
+        is one past its deepest parent, so tables within a layer never
+        reference each other.
+        """
+        depth: Dict[str, int] = {}
+        layers: List[List[str]] = []
         for table in self._src_meta.sorted_tables:
-            deps = {fk.column.table.name for fk in table.foreign_keys}
-            graph[table.name].update(deps)
-
-        # Kahn's algorithm
-        in_degree = {t: 0 for t in graph}
-        for deps in graph.values():
-            for d in deps:
-                in_degree[d] = in_degree.get(d, 0) + 1
-
-        queue = deque([t for t, deg in in_degree.items() if deg == 0])
-        order: List[str] = []
-        while queue:
-            n = queue.popleft()
-            order.append(n)
-            for m in graph[n]:
-                in_degree[m] -= 1
-                if in_degree[m] == 0:
-                    queue.append(m)
-        return order
+            # parents not seen yet only occur in FK cycles, which
+            # sorted_tables already breaks (with a warning)
+            level = 1 + max(
+                (depth.get(fk.column.table.name, -1)
+                 for fk in table.foreign_keys if fk.column.table is not table),
+                default=-1,
+            )
+            depth[table.name] = level
+            if level == len(layers):
+                layers.append([])
+            layers[level].append(table.name)
+        return layers
 
     # ------------------------------------------------------------------
 
     def _migrate_table(self, src_sess: Session, tgt_sess: Session, tbl_name: str) -> None:
         src_tbl: Table = self._src_meta.tables[tbl_name]
 
-        # check for custom split transform
-        split_fn = None
+        # check for custom split transform; the batch form wins if both exist
+        split_batch_fn = None
         if self._transforms is not None:
-            split_fn = getattr(self._transforms, f"split_{tbl_name}", None)
-
-        if split_fn:
-            self._migrate_with_split(src_sess, tgt_sess, src_tbl, split_fn)
+            split_batch_fn = getattr(self._transforms, f"split_{tbl_name}_batch", None)
+            if split_batch_fn is None:
+                split_fn = getattr(self._transforms, f"split_{tbl_name}", None)
+                if split_fn is not None:
+                    split_batch_fn = functools.partial(_split_per_row, split_fn)
+
+        if split_batch_fn:
+            self._migrate_with_split(src_sess, tgt_sess, src_tbl, split_batch_fn)
             return
 
         tgt_tbl: Table = self._tgt_meta.tables[tbl_name]
 
-        total_rows = src_sess.execute(
-            select(func.count()).select_from(src_tbl)).scalar_one()
+        # progress denominator only; exact counts are validated once per run
+        total_rows = self._estimate_rows(src_sess, src_tbl)
         copied = 0
 
         col_map = self._settings.column_maps.get(tbl_name, {})
+        insert_rows: List[Dict[str, Any]] = []
 
-        # iterate in batches (default path)
-        pk_col = list(src_tbl.primary_key.columns)[0]
-        last_pk = None
-        while True:
-            query = select(src_tbl).order_by(
-                pk_col).limit(self._settings.batch_size)
-            if last_pk is not None:
-                query = query.where(pk_col > last_pk)
-            rows = src_sess.execute(query).all()
-            if not rows:
-                break
-
-            insert_rows = []
-            for row in rows:
-                row_dict = dict(row._mapping)
-                last_pk = row_dict[pk_col.name]
-
-                # apply column mapping overrides
-                for tgt_col, src_col in col_map.items():
-                    if src_col in row_dict:
-                        row_dict[tgt_col] = row_dict[src_col]
-                # handle UUID generation if needed
-                if tbl_name in self._settings.uuid_tables:
-                    new_uuid = uuid.uuid4()
-                    self._id_maps[tbl_name][last_pk] = new_uuid
-                    row_dict[pk_col.name] = new_uuid
-
-                # remap foreign keys referencing previously converted tables
+        # fast path: verbatim copy, no Python row objects involved
+        if self._can_copy(src_tbl, tgt_tbl):
+            copied = self._copy_table(src_sess, tgt_sess, src_tbl, tgt_tbl)
+            self._progress_cb(tbl_name, copied, total_rows)
+        else:
+            # per-table plan, hoisted out of the row loop. Rows are plain value
+            # lists in target column order: the SELECT below yields the
+            # (mapped) source column for every target column it can fill.
+            out_cols: List[str] = []
+            sources = []
+            for col in tgt_tbl.columns:
+                src_name = col_map.get(col.name, col.name)
+                if src_name not in src_tbl.columns:
+                    src_name = col.name
+                if src_name in src_tbl.columns:
+                    out_cols.append(col.name)
+                    sources.append(src_tbl.columns[src_name])
+            n_out = len(out_cols)
+            positions = {name: i for i, name in enumerate(out_cols)}
+
+            needs_uuid = tbl_name in self._settings.uuid_tables
+            if needs_uuid:
+                src_pk = list(src_tbl.primary_key.columns)[0]
+                if src_pk.name in positions and sources[positions[src_pk.name]] is src_pk:
+                    old_id_pos = positions[src_pk.name]
+                else:  # old id only feeds the id map; dropped before writing
+                    old_id_pos = len(sources)
+                    sources.append(src_pk)
+                new_id_pos = positions.get(src_pk.name)
+            fk_remaps: List[Tuple[int, _IdMap]] = []
+            with self._id_maps_lock:
+                if needs_uuid:
+                    own_ids = self._id_maps[tbl_name]
                 for fk in tgt_tbl.foreign_keys:
                     ref_tbl = fk.column.table.name
-                    if ref_tbl in self._id_maps:
-                        old_val = row_dict[fk.parent.name]
-                        if old_val in self._id_maps[ref_tbl]:
-                            row_dict[fk.parent.name] = self._id_maps[ref_tbl][old_val]
-                insert_rows.append(row_dict)
-
-            # type: ignore[arg-type]
-            tgt_sess.execute(tgt_tbl.insert(), insert_rows)
-            copied += len(insert_rows)
-            self._progress_cb(tbl_name, copied, total_rows)
-
-        # post-copy integrity check
-        if self._settings.validate:
-            tgt_count = tgt_sess.execute(select(func.count()).select_from(tgt_tbl)).scalar_one()
-            if tgt_count != total_rows:
-                raise ValueError(f"Row count mismatch for {tbl_name}: source={total_rows} target={tgt_count}")
+                    if ref_tbl in self._id_maps and fk.parent.name in positions:
+                        fk_remaps.append((positions[fk.parent.name], self._id_maps[ref_tbl]))
+            mutates = needs_uuid or bool(fk_remaps)
+
+            insert_method = self._insert_method(tgt_tbl)
+
+            # stream in batches (default path): one server-side cursor
+            # instead of a keyset-paginated query per batch; positional labels
+            # let one source column feed several target columns
+            query = select(*(c.label(f"c{i}") for i, c in enumerate(sources)))
+            if needs_uuid or any(fk.column.table is src_tbl for fk in src_tbl.foreign_keys):
+                # PK order, so a self-referencing FK's parent row is usually
+                # copied (and in the id map) before the rows pointing to it
+                query = query.order_by(*src_tbl.primary_key.columns)
+            result = src_sess.execute(
+                query.execution_options(stream_results=True, yield_per=self._settings.batch_size))
+            batch: List[Any] = []
+            for partition in result.partitions():
+                if not mutates:
+                    batch = partition
+                    self._write_rows(tgt_sess, tgt_tbl, out_cols, batch, insert_method)
+                    copied += len(batch)
+                    self._progress_cb(tbl_name, copied, total_rows)
+                    continue
+
+                if needs_uuid:
+                    new_uuids = iter(_uuid4_batch(len(partition)))
+                batch = []
+                for row in partition:
+                    values = list(row)
+                    # handle UUID generation if needed
+                    if needs_uuid:
+                        new_uuid = next(new_uuids)
+                        own_ids.add(values[old_id_pos], new_uuid)
+                        if new_id_pos is not None:
+                            values[new_id_pos] = new_uuid
+                        del values[n_out:]
+
+                    # remap foreign keys referencing previously converted tables
+                    for pos, id_map in fk_remaps:
+                        old_val = values[pos]
+                        if old_val is not None:
+                            new_val = id_map.get(old_val)
+                            if new_val is not None:
+                                values[pos] = new_val
+                    batch.append(values)
+
+                self._write_rows(tgt_sess, tgt_tbl, out_cols, batch, insert_method)
+                copied += len(batch)
+                self._progress_cb(tbl_name, copied, total_rows)
+
+            if needs_uuid:
+                own_ids.freeze()
+            # post-insert hooks keep receiving the last batch as row dicts
+            insert_rows = [dict(zip(out_cols, r)) for r in batch]
+
+        with self._id_maps_lock:
+            self._copied_tables.append(tbl_name)
 
         # Add transform hook support
         if self._transforms is not None:
@@ -203,3 +452,183 @@ class MigrationExecutor:
                 transform_hook(tgt_sess, insert_rows)
 
         logger.info(f"{tbl_name}: copied {copied} rows")
+
+    def _migrate_with_split(
+        self,
+        src_sess: Session,
+        tgt_sess: Session,
+        src_tbl: Table,
+        split_batch_fn: Callable[[List[Dict[str, Any]]], Dict[str, List[Dict[str, Any]]]],
+    ) -> None:
+        """Migrate *src_tbl* through a user split hook, one source batch per call.
+
+        Target tables are inserted in the order the hook returns them, so
+        parents should come before children. Split tables change row counts,
+        so neither the source table nor any table the hook writes to (even one
+        also copied 1:1) is part of the count validation.
+        """
+        tbl_name = src_tbl.name
+        total_rows = self._estimate_rows(src_sess, src_tbl)
+        copied = 0
+        result = src_sess.execute(
+            select(src_tbl).execution_options(stream_results=True, yield_per=self._settings.batch_size))
+        for partition in result.mappings().partitions():
+            out = split_batch_fn([dict(row) for row in partition])
+            for tgt_name, tgt_rows in out.items():
+                if not tgt_rows:
+                    continue
+                if tgt_name not in self._split_targets:
+                    with self._id_maps_lock:
+                        self._split_targets.add(tgt_name)
+                tgt_sess.execute(self._tgt_meta.tables[tgt_name].insert(), tgt_rows)
+                if self._transforms is not None:
+                    transform_hook = getattr(self._transforms, f"transform_{tgt_name}", None)
+                    if transform_hook:
+                        transform_hook(tgt_sess, tgt_rows)
+            copied += len(partition)
+            self._progress_cb(tbl_name, copied, total_rows)
+        logger.info(f"{tbl_name}: split {copied} rows")
+
+    # ------------------------------------------------------------------
+
+    def _estimate_rows(self, src_sess: Session, src_tbl: Table) -> int:
+        """Return a cheap row-count estimate used for progress reporting.
+
+        PostgreSQL answers from the planner statistics in ``pg_class``; other
+        backends (and never-analysed tables) fall back to ``COUNT(*)``.
+        """
+        if self._src_engine.dialect.name == "postgresql":
+            estimate = src_sess.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:name)"),
+                {"name": self._src_engine.dialect.identifier_preparer.format_table(src_tbl)},
+            ).scalar()
+            if estimate is not None and estimate >= 0:
+                return estimate
+        return src_sess.execute(select(func.count()).select_from(src_tbl)).scalar_one()
+
+    def _validate_counts(self, src_sess: Session, tgt_sess: Session) -> None:
+        """Compare exact source/target row counts of every 1:1 copied table.
+
+        Counts are taken once at the end of the run, so tables that split
+        hooks also inserted into are skipped.
+        """
+        tables = [t for t in self._copied_tables if t not in self._split_targets]
+        src_counts = _count_rows(src_sess, [self._src_meta.tables[t] for t in tables])
+        tgt_counts = _count_rows(tgt_sess, [self._tgt_meta.tables[t] for t in tables])
+        for tbl_name in tables:
+            if src_counts[tbl_name] != tgt_counts[tbl_name]:
+                raise ValueError(
+                    f"Row count mismatch for {tbl_name}: "
+                    f"source={src_counts[tbl_name]} target={tgt_counts[tbl_name]}")
+
+    # ------------------------------------------------------------------
+
+    def _insert_method(self, tgt_tbl: Table) -> str:
+        """Return the configured insert method if *tgt_tbl* supports it."""
+        method = self._settings.insert_method
+        if method not in ("values", "copy") or self._tgt_engine.dialect.name != "postgresql":
+            return "executemany"
+        allowed = _CSV_TYPES if method == "copy" else _VALUES_TYPES
+        for col in tgt_tbl.columns:
+            try:
+                py_type = col.type.python_type
+            except NotImplementedError:
+                return "executemany"
+            if not issubclass(py_type, allowed):
+                return "executemany"
+        return method
+
+    def _write_rows(self, tgt_sess: Session, tgt_tbl: Table, cols: List[str], rows: List[Any], method: str) -> None:
+        """Insert one batch of positional *rows* (values for *cols*) into *tgt_tbl*."""
+        if method == "executemany":
+            tgt_sess.execute(tgt_tbl.insert(), [dict(zip(cols, r)) for r in rows])  # type: ignore[arg-type]
+            return
+
+        prep = self._tgt_engine.dialect.identifier_preparer
+        target = f"{prep.format_table(tgt_tbl)} ({', '.join(prep.quote(c) for c in cols)})"
+        with tgt_sess.connection().connection.cursor() as cur:
+            if method == "copy":
+                cur.copy_expert(f"COPY {target} FROM STDIN WITH CSV", _csv_buffer(rows))
+            else:
+                from psycopg2.extras import execute_values, register_uuid
+
+                register_uuid(conn_or_curs=cur)
+                execute_values(cur, f"INSERT INTO {target} VALUES %s", [tuple(r) for r in rows],
+                               page_size=self._settings.batch_size)
+
+    def _can_copy(self, src_tbl: Table, tgt_tbl: Table) -> bool:
+        """Return *True* if *src_tbl* can be streamed verbatim via binary COPY.
+
+        Binary COPY skips every per-row hook, so it is only used between two
+        PostgreSQL databases for tables with no UUID conversion, column map, FK
+        remap or transform hook, whose target columns all exist in the source
+        with the identical type.
+        """
+        if self._src_engine.dialect.name != "postgresql" or self._tgt_engine.dialect.name != "postgresql":
+            return False
+        tbl_name = tgt_tbl.name
+        if tbl_name in self._settings.uuid_tables or self._settings.column_maps.get(tbl_name):
+            return False
+        if any(fk.column.table.name in self._settings.uuid_tables for fk in tgt_tbl.foreign_keys):
+            return False
+        if self._transforms is not None and getattr(self._transforms, f"transform_{tbl_name}", None):
+            return False
+
+        dialect = self._tgt_engine.dialect
+        for col in tgt_tbl.columns:
+            src_col = src_tbl.columns.get(col.name)
+            if src_col is None:
+                return False
+            try:
+                if src_col.type.compile(dialect) != col.type.compile(dialect):
+                    return False
+            except CompileError:
+                # types reflection doesn't know (PostGIS geometry, citext, ...)
+                # come back as NullType, which has no DDL to compare
+                return False
+        return True
+
+    def _copy_table(self, src_sess: Session, tgt_sess: Session, src_tbl: Table, tgt_tbl: Table) -> int:
+        """Pipe ``COPY ... TO STDOUT`` into ``COPY ... FROM STDIN`` (binary).
+
+        Both COPY statements run on the sessions' own connections so the
+        target side stays inside the run-wide transaction. A helper thread
+        drives the source side and feeds an OS pipe that the target reads from.
+        Returns the number of rows copied.
+        """
+        src_prep = self._src_engine.dialect.identifier_preparer
+        tgt_prep = self._tgt_engine.dialect.identifier_preparer
+        src_cols = ", ".join(src_prep.quote(c.name) for c in tgt_tbl.columns)
+        tgt_cols = ", ".join(tgt_prep.quote(c.name) for c in tgt_tbl.columns)
+        copy_out = f"COPY {src_prep.format_table(src_tbl)} ({src_cols}) TO STDOUT WITH BINARY"
+        copy_in = f"COPY {tgt_prep.format_table(tgt_tbl)} ({tgt_cols}) FROM STDIN WITH BINARY"
+
+        read_fd, write_fd = os.pipe()
+        errors: List[BaseException] = []
+        with src_sess.connection().connection.cursor() as src_cur, \
+                tgt_sess.connection().connection.cursor() as tgt_cur:
+
+            def produce() -> None:
+                try:
+                    with os.fdopen(write_fd, "wb") as writer:
+                        src_cur.copy_expert(copy_out, writer)
+                except BaseException as exc:  # re-raised on the calling thread
+                    errors.append(exc)
+
+            producer = threading.Thread(target=produce, name=f"copy-{src_tbl.name}", daemon=True)
+            producer.start()
+            try:
+                # closing the reader unblocks the producer if the target side fails
+                with os.fdopen(read_fd, "rb") as reader:
+                    tgt_cur.copy_expert(copy_in, reader)
+            except Exception as exc:
+                producer.join()
+                if errors:
+                    # a failed source COPY truncates the stream, so the target's
+                    # error ("signature not recognized", ...) is only a symptom
+                    raise errors[0] from exc
+                raise
+            producer.join()
+            if errors:
+                raise errors[0]
+            return tgt_cur.rowcount
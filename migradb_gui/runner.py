@@ -4,7 +4,7 @@ from __future__ import annotations
 import threading
 from typing import List, Set
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, QTimer, Signal, Slot
 from PySide6.QtWidgets import (
     QDialog,
     QDialogButtonBox,
@@ -15,10 +15,18 @@ from PySide6.QtWidgets import (
 
 from migradb_gui.connection import ConnectionPair
 from migradb_gui.migration import MigrationExecutor, MigrationSettings
+from migradb_gui.schema import reflect_metadata
 
 
 class RunnerDialog(QDialog):
-    """Dialog that executes migration in background thread."""
+    """Dialog that executes migration in background thread.
+
+    The worker never touches widgets: it emits signals that are queued to the
+    GUI thread, where log lines are buffered and flushed every 100 ms.
+    """
+
+    progress_signal = Signal(str, "qlonglong", "qlonglong")  # row counts can exceed int32
+    finished_signal = Signal(str)
 
     def __init__(self, pair: ConnectionPair, uuid_tables: Set[str], column_maps: dict[str, dict[str, str]], parent=None) -> None:
         super().__init__(parent)
@@ -41,6 +49,15 @@ class RunnerDialog(QDialog):
         layout.addWidget(btn_box)
         self.setLayout(layout)
 
+        self._pending: List[str] = []
+        self._percent = 0
+        self.progress_signal.connect(self._buffer_log, Qt.ConnectionType.QueuedConnection)
+        self.finished_signal.connect(self._on_finished, Qt.ConnectionType.QueuedConnection)
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(100)
+        self._flush_timer.timeout.connect(self._flush_log)
+        self._flush_timer.start()
+
         # start worker thread
         threading.Thread(
             target=self._run_exec,
@@ -51,17 +68,39 @@ class RunnerDialog(QDialog):
     # ------------------------------------------------------------------
 
     def _run_exec(self, pair: ConnectionPair, uuid_tables: Set[str], column_maps: dict[str, dict[str, str]]) -> None:
-        total_tables = len(uuid_tables)
-        processed_tables: int = 0
-
-        def progress_cb(tbl: str, done: int, total: int) -> None:  # noqa: D401
-            self.log.append(f"{tbl}: {done}/{total}")
-
-        exec = MigrationExecutor(pair, MigrationSettings(uuid_tables=uuid_tables, column_maps=column_maps), progress_cb)
         try:
+            exec = MigrationExecutor(pair, MigrationSettings(uuid_tables=uuid_tables, column_maps=column_maps),
+                                     self.progress_signal.emit,
+                                     src_meta=reflect_metadata(pair.source.sqlalchemy_url()),
+                                     tgt_meta=reflect_metadata(pair.target.sqlalchemy_url()))
             exec.run()
-            self.log.append("\nMigration successful ✅")
+            self.finished_signal.emit("\nMigration successful ✅")
         except Exception as exc:
-            self.log.append(f"\nMigration failed: {exc}")
+            self.finished_signal.emit(f"\nMigration failed: {exc}")
+
+    # ------------------------------------------------------------------
+    # slots (GUI thread)
+    # ------------------------------------------------------------------
+
+    @Slot(str, "qlonglong", "qlonglong")
+    def _buffer_log(self, tbl: str, done: int, total: int) -> None:
+        self._pending.append(f"{tbl}: {done}/{total}")
+        # total is an estimate (planner statistics) and may undercount; clamp
+        # so setValue() never gets an out-of-range value and ignores it
+        self._percent = min(100, (done * 100) // total) if total else 100
+
+    @Slot()
+    def _flush_log(self) -> None:
+        if not self._pending:
+            return
+        self.log.append("\n".join(self._pending))
+        self._pending.clear()
+        self.progress.setValue(self._percent)
+
+    @Slot(str)
+    def _on_finished(self, message: str) -> None:
+        self._flush_timer.stop()
+        self._flush_log()
+        self.log.append(message)
         self.progress.setValue(100)
         self._close_btn.setEnabled(True)
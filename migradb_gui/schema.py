@@ -5,14 +5,27 @@ retrieved (tables, columns, PK flag, data type). Future: constraints, FKs, etc.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List
+import hashlib
+import os
+import pickle
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import ClassVar, Dict, List, Tuple
 
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import MetaData, create_engine, inspect, text
 from sqlalchemy.engine import Engine
+from sqlalchemy.engine.default import DefaultDialect
+from sqlalchemy.engine.reflection import Inspector
+from sqlalchemy.pool import SingletonThreadPool, StaticPool
 
 
-@dataclass
+_INT_TYPES = frozenset({"integer", "bigint", "smallint"})
+
+
+@dataclass(frozen=True, slots=True)
 class ColumnInfo:
     """Metadata about a database column."""
 
@@ -22,52 +35,241 @@ class ColumnInfo:
 
     def is_incremental_pk(self) -> bool:
         """Return *True* if the column looks like a serial/incremental PK."""
-        # naive heuristics: integer type and part of pk
-        return self.is_primary and self.data_type in {
-            "integer",
-            "bigint",
-            "smallint",
-        }
+        # naive heuristics: integer type and part of pk; reflected type names
+        # are upper case ("INTEGER")
+        return self.is_primary and self.data_type.lower() in _INT_TYPES
 
     def is_uuid_pk(self) -> bool:
-        return self.is_primary and self.data_type == "uuid"
+        return self.is_primary and self.data_type.lower() == "uuid"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TableInfo:
     """Metadata about a database table."""
 
     name: str
     columns: List[ColumnInfo]
+    _primary_keys: Tuple[ColumnInfo, ...] = field(init=False, repr=False, compare=False)
+    # bit i set <=> columns[i] is a PK / an integer PK / a UUID PK
+    pk_bits: int = field(init=False, repr=False, compare=False)
+    intpk_bits: int = field(init=False, repr=False, compare=False)
+    uuidpk_bits: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        pk = intpk = uuidpk = 0
+        for i, c in enumerate(self.columns):
+            if c.is_primary:
+                pk |= 1 << i
+                if c.is_incremental_pk():
+                    intpk |= 1 << i
+                elif c.is_uuid_pk():
+                    uuidpk |= 1 << i
+        object.__setattr__(self, "_primary_keys", tuple(c for c in self.columns if c.is_primary))
+        object.__setattr__(self, "pk_bits", pk)
+        object.__setattr__(self, "intpk_bits", intpk)
+        object.__setattr__(self, "uuidpk_bits", uuidpk)
 
     @property
-    def primary_keys(self) -> List[ColumnInfo]:
-        return [c for c in self.columns if c.is_primary]
+    def primary_keys(self) -> Tuple[ColumnInfo, ...]:
+        return self._primary_keys
+
+    def has_incremental_pk(self) -> bool:
+        """Return *True* if the first PK column is an integer."""
+        return bool(self.intpk_bits & self.pk_bits & -self.pk_bits)
+
+    def has_uuid_pk(self) -> bool:
+        """Return *True* if the first PK column is a UUID."""
+        return bool(self.uuidpk_bits & self.pk_bits & -self.pk_bits)
+
+
+# list_tables() results persisted across app runs, one pickle per URL
+_DISK_CACHE_DIR = Path.home() / ".migradb" / "schema_cache"
+_DISK_CACHE_VERSION = 3
+
+# threads for per-table reflection; stays within the default pool size plus
+# overflow so workers don't queue for connections
+_REFLECT_WORKERS = 8
+
+# cheap probe that changes whenever tables or columns are created, altered or
+# dropped: row counts and newest xmin of the catalogs list_tables() reads
+_PG_SIGNATURE_SQL = text(
+    """
+    SELECT (SELECT count(*) FROM pg_catalog.pg_class),
+           (SELECT max(xmin::text::bigint) FROM pg_catalog.pg_class),
+           (SELECT count(*) FROM pg_catalog.pg_attribute),
+           (SELECT max(xmin::text::bigint) FROM pg_catalog.pg_attribute),
+           (SELECT count(*) FROM pg_catalog.pg_constraint),
+           (SELECT max(xmin::text::bigint) FROM pg_catalog.pg_constraint)
+    """
+)
+
+
+def _disk_cache_path(sqlalchemy_url: str) -> Path:
+    return _DISK_CACHE_DIR / f"{hashlib.sha1(sqlalchemy_url.encode()).hexdigest()}.pkl"
 
 
 class SchemaInspector:
-    """Introspect PostgreSQL schema via SQLAlchemy."""
+    """Introspect PostgreSQL schema via SQLAlchemy.
+
+    Engines, inspectors and ``list_tables`` results are shared per URL across
+    instances until :meth:`invalidate` is called for that URL.
+    """
+
+    _ENGINE_CACHE: ClassVar[Dict[str, Engine]] = {}
+    _INSPECTOR_CACHE: ClassVar[Dict[str, Inspector]] = {}
+    _TABLES_CACHE: ClassVar[Dict[str, List[TableInfo]]] = {}
+    _CACHE_LOCK: ClassVar[threading.Lock] = threading.Lock()
 
     def __init__(self, sqlalchemy_url: str) -> None:
-        self._engine: Engine = create_engine(sqlalchemy_url, future=True)
-        self._inspector = inspect(self._engine)
+        self._url = sqlalchemy_url
+        # create_engine() does not connect; the first query does
+        with self._CACHE_LOCK:
+            engine = self._ENGINE_CACHE.get(sqlalchemy_url)
+            if engine is None:
+                engine = self._ENGINE_CACHE[sqlalchemy_url] = create_engine(
+                    sqlalchemy_url, future=True
+                )
+        self._engine: Engine = engine
+
+    @property
+    def _inspector(self) -> Inspector:
+        # inspect() connects to the database, so defer it until first use
+        insp = self._INSPECTOR_CACHE.get(self._url)
+        if insp is None:
+            with self._CACHE_LOCK:
+                insp = self._INSPECTOR_CACHE.get(self._url)
+                if insp is None:
+                    insp = self._INSPECTOR_CACHE[self._url] = inspect(self._engine)
+        return insp
+
+    @classmethod
+    def invalidate(cls, sqlalchemy_url: str) -> None:
+        """Drop everything cached for *sqlalchemy_url* (e.g. after DDL)."""
+        with cls._CACHE_LOCK:
+            cls._TABLES_CACHE.pop(sqlalchemy_url, None)
+            cls._INSPECTOR_CACHE.pop(sqlalchemy_url, None)
+            engine = cls._ENGINE_CACHE.pop(sqlalchemy_url, None)
+        with _META_LOCK:
+            _META_CACHE.pop(sqlalchemy_url, None)
+        if engine is not None:
+            engine.dispose()
+        _disk_cache_path(sqlalchemy_url).unlink(missing_ok=True)
 
     # ------------------------------------------------------------------
     # public API
     # ------------------------------------------------------------------
 
     def list_tables(self) -> List[TableInfo]:  # noqa: D401
+        cached = self._TABLES_CACHE.get(self._url)
+        if cached is not None:
+            return list(cached)
+        signature = self._schema_signature()
+        tables = self._load_disk_cache(signature) if signature is not None else None
+        if tables is None:
+            tables = self._reflect_tables()
+            if signature is not None:
+                self._save_disk_cache(signature, tables)
+        self._TABLES_CACHE[self._url] = tables
+        return list(tables)
+
+    # ------------------------------------------------------------------
+    # internals
+    # ------------------------------------------------------------------
+
+    def _reflect_tables(self) -> List[TableInfo]:
+        if type(self._engine.dialect).get_multi_columns is not DefaultDialect.get_multi_columns:
+            # one query each for all columns and all PKs, instead of two per table
+            multi_cols = self._inspector.get_multi_columns()
+            multi_pks = self._inspector.get_multi_pk_constraint()
+        else:
+            multi_cols, multi_pks = self._reflect_per_table()
         tables: List[TableInfo] = []
-        for table_name in self._inspector.get_table_names():
-            pk_set = set(self._inspector.get_pk_constraint(table_name)["constrained_columns"])
-            cols: List[ColumnInfo] = []
-            for col in self._inspector.get_columns(table_name):
-                cols.append(
-                    ColumnInfo(
-                        name=col["name"],
-                        data_type=str(col["type"]),
-                        is_primary=col["name"] in pk_set,
-                    )
+        for key in sorted(multi_cols, key=lambda k: k[1]):
+            pk_cols = multi_pks.get(key, {}).get("constrained_columns") or ()
+            # most PKs are a single column: compare names instead of building
+            # a set per table
+            single_pk = pk_cols[0] if len(pk_cols) == 1 else None
+            pk_set = frozenset(pk_cols) if single_pk is None else frozenset()
+            cols = [
+                ColumnInfo(
+                    name=col["name"],
+                    # type names repeat across thousands of columns
+                    data_type=sys.intern(str(col["type"])),
+                    is_primary=(col["name"] == single_pk) if single_pk is not None else col["name"] in pk_set,
                 )
-            tables.append(TableInfo(name=table_name, columns=cols))
+                for col in multi_cols[key]
+            ]
+            tables.append(TableInfo(name=key[1], columns=cols))
+        return tables
+
+    def _reflect_per_table(self) -> Tuple[Dict[Tuple[None, str], List], Dict[Tuple[None, str], Dict]]:
+        """Reflect table by table for dialects without bulk reflection.
+
+        The per-table queries are I/O bound, so they run on a few threads,
+        each with its own Inspector (Inspector is not thread-safe) sharing the
+        engine's connection pool. Pools that hand every thread the same
+        connection are reflected serially.
+        """
+        names = self._inspector.get_table_names()
+        if isinstance(self._engine.pool, (SingletonThreadPool, StaticPool)) or len(names) < 2:
+            insp = self._inspector
+            results = [(insp.get_columns(n), insp.get_pk_constraint(n)) for n in names]
+        else:
+            def reflect_one(name: str) -> Tuple[List, Dict]:
+                insp = inspect(self._engine)
+                return insp.get_columns(name), insp.get_pk_constraint(name)
+
+            with ThreadPoolExecutor(max_workers=min(_REFLECT_WORKERS, len(names))) as pool:
+                results = list(pool.map(reflect_one, names))
+        multi_cols = {(None, n): cols for n, (cols, _) in zip(names, results)}
+        multi_pks = {(None, n): pk for n, (_, pk) in zip(names, results)}
+        return multi_cols, multi_pks
+
+    def _schema_signature(self) -> Tuple | None:
+        """Return the catalog probe result, or *None* if unsupported."""
+        if self._engine.dialect.name != "postgresql":
+            return None
+        with self._engine.connect() as conn:
+            return tuple(conn.execute(_PG_SIGNATURE_SQL).one())
+
+    def _load_disk_cache(self, signature: Tuple) -> List[TableInfo] | None:
+        try:
+            with _disk_cache_path(self._url).open("rb") as fh:
+                version, stored_sig, tables = pickle.load(fh)
+        except Exception:
+            # missing, corrupt or written by an incompatible version
+            return None
+        if version != _DISK_CACHE_VERSION or stored_sig != signature:
+            return None
         return tables
+
+    def _save_disk_cache(self, signature: Tuple, tables: List[TableInfo]) -> None:
+        path = _disk_cache_path(self._url)
+        tmp = path.with_suffix(".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tmp.open("wb") as fh:
+                pickle.dump((_DISK_CACHE_VERSION, signature, tables), fh, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except OSError:
+            # the cache is an optimisation only
+            tmp.unlink(missing_ok=True)
+
+
+# fully reflected MetaData per URL, shared by every migration run
+_META_CACHE: Dict[str, MetaData] = {}
+_META_LOCK = threading.Lock()
+
+
+def reflect_metadata(sqlalchemy_url: str) -> MetaData:
+    """Return reflected :class:`MetaData` for *sqlalchemy_url*, reflecting once.
+
+    Runs on the migration worker thread, hence the lock.
+    """
+    with _META_LOCK:
+        meta = _META_CACHE.get(sqlalchemy_url)
+        if meta is None:
+            meta = MetaData()
+            meta.reflect(bind=SchemaInspector(sqlalchemy_url)._engine)
+            _META_CACHE[sqlalchemy_url] = meta
+        return meta
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 from typing import Any, Dict
 
@@ -11,19 +12,31 @@ _CONFIG_DIR = Path.home() / ".migradb"
 _CONFIG_DIR.mkdir(exist_ok=True)
 _MAP_FILE = _CONFIG_DIR / "mappings.json"
 
+# last parsed file contents, reused while the file's mtime is unchanged
+_CACHE: Dict[str, Any] = {"mtime": None, "data": None}
+
 
 def _load_file() -> Dict[str, Any]:
-    if _MAP_FILE.exists():
+    try:
+        mtime = _MAP_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    if _CACHE["mtime"] != mtime:
         try:
-            return json.loads(_MAP_FILE.read_text())
+            data = json.loads(_MAP_FILE.read_bytes())
         except Exception:
             # corrupt file
-            return {}
-    return {}
+            data = {}
+        _CACHE["mtime"], _CACHE["data"] = mtime, data
+    return _CACHE["data"]
 
 
 def _save_file(data: Dict[str, Any]) -> None:
-    _MAP_FILE.write_text(json.dumps(data, indent=2))
+    # write-then-rename so a crash never leaves a truncated mappings file
+    tmp = _MAP_FILE.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(data, indent=2))
+    os.replace(tmp, _MAP_FILE)
+    _CACHE["mtime"], _CACHE["data"] = _MAP_FILE.stat().st_mtime_ns, data
 
 
 def _pair_key(pair: ConnectionPair) -> str:
@@ -33,10 +46,12 @@ def _pair_key(pair: ConnectionPair) -> str:
 
 def load_mappings(pair: ConnectionPair) -> Dict[str, Dict[str, str]]:  # noqa: D401
     data = _load_file()
-    return data.get(_pair_key(pair), {})
+    # copy so callers can't mutate the cached file contents
+    return {tbl: dict(cols) for tbl, cols in data.get(_pair_key(pair), {}).items()}
 
 
 def save_mappings(pair: ConnectionPair, maps: Dict[str, Dict[str, str]]) -> None:  # noqa: D401
-    data = _load_file()
-    data[_pair_key(pair)] = maps
+    data = dict(_load_file())
+    # copy so later edits to *maps* don't leak into the cached file contents
+    data[_pair_key(pair)] = {tbl: dict(cols) for tbl, cols in maps.items()}
     _save_file(data)
@@ -5,41 +5,51 @@ syntax highlighting courtesy of Qt (fallback to plain text).
 """
 from __future__ import annotations
 
+import importlib
+import py_compile
+import sys
 from pathlib import Path
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QRegularExpression, Qt, Slot
 from PySide6.QtGui import QFont, QSyntaxHighlighter, QTextCharFormat, QColor, QTextDocument
 from PySide6.QtWidgets import (
     QDialog,
     QDialogButtonBox,
+    QMessageBox,
     QPlainTextEdit,
     QVBoxLayout,
 )
 
 TRANSFORM_PATH = Path(__file__).with_name("transforms.py")
+_TRANSFORM_MODULE = "migradb_gui.transforms"
 
 
 class _PythonHighlighter(QSyntaxHighlighter):
     """Very lightweight Python syntax highlighter."""
 
+    _KEYWORDS = (
+        "def", "return", "import", "from", "as", "if", "else", "for", "while", "try", "except", "class", "with", "yield", "lambda", "True", "False", "None",
+    )
+    # one alternation matched in a single pass per block
+    _KEYWORD_RE = QRegularExpression(rf"\b(?:{'|'.join(_KEYWORDS)})\b")
+    _KEYWORD_INITIALS = frozenset(kw[0] for kw in _KEYWORDS)
+
     def __init__(self, doc: QTextDocument) -> None:
         super().__init__(doc)
-        kw_format = QTextCharFormat()
-        kw_format.setForeground(QColor("blue"))
-        self._rules = [(rf"\b{kw}\b", kw_format) for kw in (
-            "def", "return", "import", "from", "as", "if", "else", "for", "while", "try", "except", "class", "with", "yield", "lambda", "True", "False", "None",
-        )]
+        self._kw_format = QTextCharFormat()
+        self._kw_format.setForeground(QColor("blue"))
 
     def highlightBlock(self, text: str) -> None:  # noqa: D401
-        for pattern, fmt in self._rules:
-            i = 0
-            while True:
-                i = text.find(pattern.strip("\\b"), i)
-                if i == -1:
-                    break
-                length = len(pattern.strip("\\b"))
-                self.setFormat(i, length, fmt)
-                i += length
+        # Qt only calls this for edited blocks (block state is left at its
+        # default, so edits never cascade); skip blank, comment-only and
+        # keyword-free lines without running the regex
+        stripped = text.lstrip()
+        if not stripped or stripped[0] == "#" or self._KEYWORD_INITIALS.isdisjoint(stripped):
+            return
+        it = self._KEYWORD_RE.globalMatch(text)
+        while it.hasNext():
+            m = it.next()
+            self.setFormat(m.capturedStart(), m.capturedLength(), self._kw_format)
 
 
 class TransformEditorDialog(QDialog):
@@ -53,13 +63,19 @@ class TransformEditorDialog(QDialog):
         self.editor = QPlainTextEdit()
         font = QFont("Courier New", 10)
         self.editor.setFont(font)
-        _PythonHighlighter(self.editor.document())
+        self.editor.setCenterOnScroll(False)
 
         if TRANSFORM_PATH.exists():
+            # load with no highlighter or undo recording attached; the
+            # highlighter then does a single pass over the finished document
+            doc = self.editor.document()
+            doc.setUndoRedoEnabled(False)
             self.editor.setPlainText(TRANSFORM_PATH.read_text())
+            doc.setUndoRedoEnabled(True)
         else:
             # create initial template
             TRANSFORM_PATH.write_text("\n")
+        self._highlighter = _PythonHighlighter(self.editor.document())
 
         btns = QDialogButtonBox(QDialogButtonBox.StandardButton.Save | QDialogButtonBox.StandardButton.Cancel)
         btns.accepted.connect(self._on_save)
@@ -72,6 +88,21 @@ class TransformEditorDialog(QDialog):
 
     # ------------------------------------------------------------------
 
+    @Slot()
     def _on_save(self) -> None:
         TRANSFORM_PATH.write_text(self.editor.toPlainText())
+        # byte-compile now and drop the stale module, so the next migration
+        # run imports the edited hooks from a ready .pyc
+        sys.modules.pop(_TRANSFORM_MODULE, None)
+        try:
+            py_compile.compile(str(TRANSFORM_PATH), doraise=True)
+            importlib.invalidate_caches()
+            importlib.import_module(_TRANSFORM_MODULE)
+        except py_compile.PyCompileError as exc:
+            QMessageBox.warning(self, "Transform Hooks", f"Saved, but the file has errors:\n{exc.msg}")
+            return
+        except Exception as exc:
+            sys.modules.pop(_TRANSFORM_MODULE, None)
+            QMessageBox.warning(self, "Transform Hooks", f"Saved, but importing it failed:\n{exc}")
+            return
         self.accept()
@@ -24,6 +24,27 @@ def split_customers(row):
     }
 ```
 
+Tables with many rows can instead define `split_<source_table>_batch`, which
+receives a list of row dicts (one batch of `batch_size` source rows) and
+returns the same target-table mapping for the whole batch. It takes precedence
+over `split_<source_table>` and saves one Python call per row:
+
+```python
+def split_customers_batch(rows):
+    customers, phones = [], []
+    for row in rows:
+        cust_id = uuid.uuid4()
+        customers.append({"id": cust_id, "name": row["full_name"]})
+        phones.extend(
+            {"customer_id": cust_id, "number": p.strip()}
+            for p in row["phones"].split(";") if p.strip()
+        )
+    return {"customers": customers, "customer_phone": phones}
+```
+
+Target tables are inserted in the order they appear in the returned dict, so
+list parent tables before their children.
+
 Optional post-insert hook:
 
 Define `transform_<target_table>(session, rows)` to run immediately after a
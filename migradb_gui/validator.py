@@ -2,47 +2,161 @@
 from __future__ import annotations
 
 import hashlib
-from typing import Dict, List
+import struct
+from typing import Any, Callable, Dict, FrozenSet, List, Tuple
 
-from sqlalchemy import Table, select, func
+from sqlalchemy import Column, Table, Text, cast, func, literal, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.orm import Session
 
+_PACK_INT = struct.Struct("<q").pack
+_PACK_FLOAT = struct.Struct("<d").pack
+_INT64_MIN, _INT64_MAX = -(1 << 63), (1 << 63) - 1
+
+
+def _tagged_text(tag: bytes, data: bytes) -> bytes:
+    # length prefix keeps the record self-delimiting whatever *data* contains
+    return tag + _PACK_INT(len(data)) + data
+
+
+def _encode_int(v: int) -> bytes:
+    if _INT64_MIN <= v <= _INT64_MAX:
+        return b"I" + _PACK_INT(v)
+    return _tagged_text(b"B", str(v).encode())
+
+
+def _encode_other(v: Any) -> bytes:
+    return _tagged_text(b"R", repr(v).encode("utf-8", "surrogatepass"))
+
+
+# exact type -> encoder producing one tagged, self-delimiting record per value;
+# bool and other int subclasses fall back to repr() so True != 1
+_ENCODERS: Dict[type, Callable[[Any], bytes]] = {
+    str: lambda v: _tagged_text(b"S", v.encode("utf-8", "surrogatepass")),
+    int: _encode_int,
+    float: lambda v: b"F" + _PACK_FLOAT(v),
+    bytes: lambda v: _tagged_text(b"Y", v),
+    type(None): lambda v: b"N",
+}
+
+
+class _ColumnDigest:
+    """Order-sensitive MD5 of one column's values, fed a batch at a time.
+
+    Every value becomes its own tagged record, so the digest does not depend
+    on how rows are split into batches.
+    """
+
+    __slots__ = ("_md5",)
+
+    def __init__(self) -> None:
+        self._md5 = hashlib.md5()
+
+    def update(self, values: Tuple[Any, ...]) -> None:
+        get = _ENCODERS.get
+        self._md5.update(b"".join([get(type(v), _encode_other)(v) for v in values]))
+
+    def hexdigest(self) -> str:
+        return self._md5.hexdigest()
+
+
+def _summarize(tbl: Table) -> Tuple[int, FrozenSet[str], FrozenSet[str]]:
+    """Return (PK column count, NOT NULL column names, FK target tables)."""
+    not_null = []
+    for c in tbl.columns:
+        if not c.nullable:
+            not_null.append(c.name)
+    fk_tables = frozenset(fk.column.table.name for fk in tbl.foreign_keys)
+    return len(tbl.primary_key.columns), frozenset(not_null), fk_tables
+
 
 def compare_constraints(src_tbl: Table, tgt_tbl: Table) -> List[str]:  # noqa: D401
     """Return list of discrepancies between source and target constraints."""
     issues: List[str] = []
-    if len(src_tbl.primary_key.columns) != len(tgt_tbl.primary_key.columns):
+    src_pk_count, src_nn, src_fk = _summarize(src_tbl)
+    tgt_pk_count, tgt_nn, tgt_fk = _summarize(tgt_tbl)
+    if src_pk_count != tgt_pk_count:
         issues.append("Primary key column count mismatch")
 
     # not-null columns
-    src_nn = {c.name for c in src_tbl.columns if not c.nullable}
-    tgt_nn = {c.name for c in tgt_tbl.columns if not c.nullable}
     if src_nn != tgt_nn:
-        issues.append(f"NOT NULL columns differ: src={src_nn ^ tgt_nn}")
+        issues.append(f"NOT NULL columns differ: src={set(src_nn ^ tgt_nn)}")
 
     # FK names sets
-    src_fk = {fk.column.table.name for fk in src_tbl.foreign_keys}
-    tgt_fk = {fk.column.table.name for fk in tgt_tbl.foreign_keys}
     if src_fk - tgt_fk:
-        issues.append(f"Missing FKs in target: {src_fk - tgt_fk}")
+        issues.append(f"Missing FKs in target: {set(src_fk - tgt_fk)}")
     return issues
 
 
 def column_checksums(session: Session, tbl: Table, batch_size: int = 1000) -> Dict[str, str]:  # noqa: D401
-    """Compute MD5 checksum per column by concatenating values (simple)."""
-    col_checks: Dict[str, hashlib._hashlib.HASH] = {c.name: hashlib.md5() for c in tbl.columns}
-    pk_col = list(tbl.primary_key.columns)[0]
-    last_pk = None
-    while True:
-        q = select(tbl).order_by(pk_col).limit(batch_size)
-        if last_pk is not None:
-            q = q.where(pk_col > last_pk)
-        rows = session.execute(q).all()
-        if not rows:
-            break
-        for row in rows:
-            mapping = row._mapping
-            last_pk = mapping[pk_col.name]
-            for name, value in mapping.items():
-                col_checks[name].update(repr(value).encode())
-    return {k: v.hexdigest() for k, v in col_checks.items()}
+    """Compute an MD5 checksum per column over all rows in primary-key order.
+
+    On PostgreSQL the digests are computed server-side and only one hex string
+    per column is transferred. Digests are comparable between two databases of
+    the same backend only, since values are rendered differently on each path.
+    """
+    pk_cols = list(tbl.primary_key.columns)
+    if not pk_cols:
+        raise ValueError(f"Table {tbl.name!r} has no primary key")
+    if session.get_bind().dialect.name == "postgresql":
+        return _pg_column_checksums(session, tbl, pk_cols, batch_size)
+    return _py_column_checksums(session, tbl, pk_cols, batch_size)
+
+
+def _pg_column_checksums(
+    session: Session, tbl: Table, pk_cols: List[Column], batch_size: int
+) -> Dict[str, str]:
+    # md5 per cell, md5 per chunk of batch_size rows, md5 over the chunk
+    # digests; keeps every string_agg bounded to batch_size * 32 bytes
+    rn = (func.row_number().over(order_by=pk_cols) - 1).label("rn")
+    cells = [
+        func.coalesce(func.md5(cast(c, Text)), "-").label(f"c{i}")
+        for i, c in enumerate(tbl.columns)
+    ]
+    numbered = select(rn, *cells).subquery()
+    chunk = (numbered.c.rn // batch_size).label("chunk")
+    chunks = (
+        select(
+            chunk,
+            *[
+                func.md5(
+                    func.string_agg(
+                        numbered.c[f"c{i}"], aggregate_order_by(literal(""), numbered.c.rn)
+                    )
+                ).label(f"c{i}")
+                for i in range(len(cells))
+            ],
+        )
+        .group_by(chunk)
+        .subquery()
+    )
+    stmt = select(
+        *[
+            func.md5(
+                func.coalesce(
+                    func.string_agg(chunks.c[f"c{i}"], aggregate_order_by(literal(""), chunks.c.chunk)),
+                    "",
+                )
+            )
+            for i in range(len(cells))
+        ]
+    )
+    digests = session.execute(stmt).one()
+    return {c.name: d for c, d in zip(tbl.columns, digests)}
+
+
+def _py_column_checksums(
+    session: Session, tbl: Table, pk_cols: List[Column], batch_size: int
+) -> Dict[str, str]:
+    names = [c.name for c in tbl.columns]
+    digests = [_ColumnDigest() for _ in names]
+    # one streamed query instead of a keyset-paginated query per batch
+    result = session.execute(
+        select(tbl)
+        .order_by(*pk_cols)
+        .execution_options(stream_results=True, yield_per=batch_size)
+    )
+    for rows in result.partitions():
+        for digest, values in zip(digests, zip(*rows)):
+            digest.update(values)
+    return {name: d.hexdigest() for name, d in zip(names, digests)}
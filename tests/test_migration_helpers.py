@@ -0,0 +1,288 @@
+"""Unit tests for the pure helpers in :mod:`migradb_gui.migration`."""
+from __future__ import annotations
+
+import types
+import uuid
+
+import pytest
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    ForeignKey,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Uuid,
+    create_engine,
+    insert,
+    select,
+)
+from sqlalchemy.orm import Session
+
+from migradb_gui.connection import ConnectionPair, PgConnection
+from migradb_gui.migration import MigrationExecutor, MigrationSettings, _csv_buffer, _IdMap, _uuid4_batch
+
+
+def _executor(src_engine, tgt_engine, src_meta, tgt_meta, transforms=None, **settings):
+    """Return a fully initialised executor running on the given engines."""
+    conn = PgConnection(host="localhost", database="db", user="u", password="p")
+    settings = MigrationSettings(**{"uuid_tables": set(), "column_maps": {}, **settings})
+    executor = MigrationExecutor(ConnectionPair(conn, conn), settings, src_meta=src_meta, tgt_meta=tgt_meta)
+    # create_engine() does not connect, so the PostgreSQL engines are never used
+    executor._src_engine, executor._tgt_engine = src_engine, tgt_engine
+    executor._transforms = transforms
+    return executor
+
+
+def test_uuid4_batch_sets_version_and_variant():  # noqa: D401
+    ids = _uuid4_batch(500)
+    assert len(ids) == 500
+    assert len(set(ids)) == 500
+    for u in ids:
+        assert u.version == 4
+        assert u.variant == uuid.RFC_4122
+
+
+def test_uuid4_batch_empty():  # noqa: D401
+    assert _uuid4_batch(0) == []
+
+
+def test_id_map_lookup_after_unordered_inserts():  # noqa: D401
+    ids = _IdMap()
+    new = _uuid4_batch(5)
+    for old, u in zip((30, 10, 50, 20, 40), new):
+        ids.add(old, u)
+    ids.freeze()
+    assert len(ids) == 5
+    assert ids.get(10) == new[1]
+    assert ids.get(50) == new[2]
+    assert ids.get(40) == new[4]
+    assert ids.get(35) is None
+
+
+def test_id_map_interleaved_add_and_get_without_freeze():  # noqa: D401
+    ids = _IdMap()
+    new = _uuid4_batch(6)
+    for old, u in zip((5, 7, 3, 9, 1, 8), new):
+        ids.add(old, u)
+        assert ids.get(old) == u
+    assert [ids.get(o) for o in (5, 7, 3, 9, 1, 8)] == new
+    assert ids.get(4) is None and ids.get(10) is None
+    ids.freeze()
+    assert [ids.get(o) for o in (5, 7, 3, 9, 1, 8)] == new
+
+
+def test_determine_order_layers_parents_first():  # noqa: D401
+    meta = MetaData()
+    Table("orders", meta, Column("id", Integer, primary_key=True), Column("user_id", ForeignKey("users.id")))
+    Table("users", meta, Column("id", Integer, primary_key=True), Column("manager_id", ForeignKey("users.id")))
+    Table("tags", meta, Column("id", Integer, primary_key=True))
+
+    executor = _executor(None, None, meta, MetaData())
+    assert [sorted(layer) for layer in executor._determine_order()] == [["tags", "users"], ["orders"]]
+
+
+def test_insert_page_size_follows_batch_size():  # noqa: D401
+    conn = PgConnection(host="localhost", database="db", user="u", password="p")
+    settings = MigrationSettings(uuid_tables=set(), column_maps={}, batch_size=2500)
+    executor = MigrationExecutor(ConnectionPair(conn, conn), settings, src_meta=MetaData(), tgt_meta=MetaData())
+    assert executor._tgt_engine.dialect.insertmanyvalues_page_size == 2500
+
+
+def _split_executor(transforms):
+    src_engine, tgt_engine = create_engine("sqlite://"), create_engine("sqlite://")
+    src_meta, tgt_meta = MetaData(), MetaData()
+    src = Table("customers", src_meta, Column("id", Integer, primary_key=True), Column("phones", String))
+    Table("customers", tgt_meta, Column("id", Integer, primary_key=True))
+    Table("phones", tgt_meta, Column("customer_id", Integer), Column("number", String))
+    src_meta.create_all(src_engine)
+    tgt_meta.create_all(tgt_engine)
+    with src_engine.begin() as conn:
+        conn.execute(insert(src), [{"id": i, "phones": f"{i}a;{i}b"} for i in range(1, 6)])
+
+    executor = _executor(src_engine, tgt_engine, src_meta, tgt_meta, transforms, batch_size=2)
+    return executor, src_engine, tgt_engine, tgt_meta
+
+
+def _split_one(row):
+    return {
+        "customers": [{"id": row["id"]}],
+        "phones": [{"customer_id": row["id"], "number": p} for p in row["phones"].split(";")],
+    }
+
+
+def test_split_hooks_per_row_and_batch_insert_same_rows():  # noqa: D401
+    calls = []
+
+    def split_customers_batch(rows):
+        calls.append(len(rows))
+        out = {"customers": [], "phones": []}
+        for row in rows:
+            for tbl, new_rows in _split_one(row).items():
+                out[tbl].extend(new_rows)
+        return out
+
+    results = []
+    for hooks in (types.SimpleNamespace(split_customers=_split_one),
+                  types.SimpleNamespace(split_customers=_split_one, split_customers_batch=split_customers_batch)):
+        executor, src_engine, tgt_engine, tgt_meta = _split_executor(hooks)
+        with Session(src_engine) as src_sess, Session(tgt_engine) as tgt_sess:
+            executor._migrate_table(src_sess, tgt_sess, "customers")
+            results.append((
+                tgt_sess.execute(select(tgt_meta.tables["customers"])).all(),
+                sorted(tgt_sess.execute(select(tgt_meta.tables["phones"])).all()),
+            ))
+    assert calls == [2, 2, 1]
+    assert results[0] == results[1]
+    assert len(results[0][0]) == 5 and len(results[0][1]) == 10
+
+
+def test_self_referencing_uuid_table_copied_in_pk_order():  # noqa: D401
+    src_engine, tgt_engine = create_engine("sqlite://"), create_engine("sqlite://")
+    src_meta, tgt_meta = MetaData(), MetaData()
+    # BigInteger PKs are not rowid aliases, so rows are stored in insert order
+    src = Table("users", src_meta, Column("id", BigInteger, primary_key=True),
+                Column("boss_id", BigInteger, ForeignKey("users.id")))
+    Table("users", tgt_meta, Column("id", Uuid, primary_key=True), Column("boss_id", Uuid, ForeignKey("users.id")))
+    src_meta.create_all(src_engine)
+    tgt_meta.create_all(tgt_engine)
+    with src_engine.begin() as conn:
+        conn.execute(insert(src), [{"id": 3, "boss_id": 2}, {"id": 2, "boss_id": 1}, {"id": 1, "boss_id": None}])
+
+    executor = _executor(src_engine, tgt_engine, src_meta, tgt_meta, uuid_tables={"users"}, batch_size=2)
+
+    with Session(src_engine) as src_sess, Session(tgt_engine) as tgt_sess:
+        executor._migrate_table(src_sess, tgt_sess, "users")
+        rows = tgt_sess.execute(select(tgt_meta.tables["users"])).all()
+
+    ids = executor._id_maps["users"]
+    assert sorted(rows, key=lambda r: r.id) == sorted(
+        [(ids.get(1), None), (ids.get(2), ids.get(1)), (ids.get(3), ids.get(2))], key=lambda r: r[0])
+
+
+def test_can_copy_falls_back_for_unknown_column_types():  # noqa: D401
+    from sqlalchemy.types import NullType
+
+    pg = create_engine("postgresql+psycopg2://u:p@localhost/db")  # never connects
+    tables = []
+    for meta in (MetaData(), MetaData()):
+        tables.append(Table("shapes", meta, Column("id", Integer, primary_key=True), Column("geom", NullType)))
+    executor = _executor(pg, pg, tables[0].metadata, tables[1].metadata)
+    assert executor._can_copy(*tables) is False
+
+    plain = [Table("tags", meta, Column("id", Integer, primary_key=True)) for meta in (MetaData(), MetaData())]
+    assert executor._can_copy(*plain) is True
+
+
+def _uuid_parent_child_dbs(tmp_path):
+    """File-backed source/target with a UUID-converted parent and two children."""
+    src_engine = create_engine(f"sqlite:///{tmp_path / 'src.db'}")
+    tgt_engine = create_engine(f"sqlite:///{tmp_path / 'tgt.db'}")
+    src_meta, tgt_meta = MetaData(), MetaData()
+    for meta, key in ((src_meta, Integer), (tgt_meta, Uuid)):
+        Table("users", meta, Column("id", key, primary_key=True), Column("name", String))
+        Table("tags", meta, Column("id", Integer, primary_key=True))
+        for child in ("orders", "notes"):
+            Table(child, meta, Column("id", Integer, primary_key=True), Column("user_id", key, ForeignKey("users.id")))
+    src_meta.create_all(src_engine)
+    tgt_meta.create_all(tgt_engine)
+    with src_engine.begin() as conn:
+        conn.execute(insert(src_meta.tables["users"]), [{"id": i, "name": f"u{i}"} for i in range(1, 8)])
+        conn.execute(insert(src_meta.tables["tags"]), [{"id": i} for i in range(1, 4)])
+        for child in ("orders", "notes"):
+            conn.execute(insert(src_meta.tables[child]),
+                         [{"id": i, "user_id": None if i == 5 else i % 7 + 1} for i in range(1, 21)])
+    return src_engine, tgt_engine, src_meta, tgt_meta
+
+
+def test_parallel_run_remaps_child_fks_to_parent_uuids(tmp_path):  # noqa: D401
+    src_engine, tgt_engine, src_meta, tgt_meta = _uuid_parent_child_dbs(tmp_path)
+    executor = _executor(src_engine, tgt_engine, src_meta, tgt_meta,
+                         uuid_tables={"users"}, batch_size=3, max_workers=4)
+    executor.run()
+
+    ids = executor._id_maps["users"]
+    with Session(tgt_engine) as sess:
+        assert sorted(sess.execute(select(tgt_meta.tables["users"].c.id)).scalars()) == sorted(
+            ids.get(i) for i in range(1, 8))
+        for child in ("orders", "notes"):
+            rows = dict(sess.execute(select(tgt_meta.tables[child])).all())
+            assert rows == {i: None if i == 5 else ids.get(i % 7 + 1) for i in range(1, 21)}
+    assert sorted(executor._copied_tables) == ["notes", "orders", "tags", "users"]
+
+
+def test_parallel_run_rolls_back_only_the_failing_table(tmp_path):  # noqa: D401
+    src_engine, tgt_engine, src_meta, tgt_meta = _uuid_parent_child_dbs(tmp_path)
+
+    def transform_orders(sess, rows):
+        raise RuntimeError("boom")
+
+    executor = _executor(src_engine, tgt_engine, src_meta, tgt_meta,
+                         types.SimpleNamespace(transform_orders=transform_orders),
+                         uuid_tables={"users"}, max_workers=2)
+    with pytest.raises(RuntimeError, match="boom"):
+        executor.run()
+
+    counts = {}
+    with Session(tgt_engine) as sess:
+        for name, tbl in tgt_meta.tables.items():
+            counts[name] = len(sess.execute(select(tbl)).all())
+    # the first layer committed table by table; orders' rows were rolled back
+    assert counts["users"] == 7 and counts["tags"] == 3
+    assert counts["orders"] == 0
+
+
+def test_run_rolls_back_on_row_count_mismatch(tmp_path):  # noqa: D401
+    src_engine, tgt_engine, src_meta, tgt_meta = _uuid_parent_child_dbs(tmp_path)
+    with tgt_engine.begin() as conn:  # leftover row makes the target count one higher
+        conn.execute(insert(tgt_meta.tables["tags"]), [{"id": 100}])
+    executor = _executor(src_engine, tgt_engine, src_meta, tgt_meta, uuid_tables={"users"})
+
+    with pytest.raises(ValueError, match="Row count mismatch for tags: source=3 target=4"):
+        executor.run()
+    with Session(tgt_engine) as sess:
+        assert sess.execute(select(tgt_meta.tables["tags"].c.id)).scalars().all() == [100]
+        assert sess.execute(select(tgt_meta.tables["users"])).all() == []
+
+
+def test_count_validation_skips_tables_split_hooks_write_to():  # noqa: D401
+    executor, src_engine, tgt_engine, _ = _split_executor(types.SimpleNamespace(split_customers=_split_one))
+    # a source phones table copied 1:1 into the same target table the hook fills
+    src_phones = Table("phones", executor._src_meta, Column("customer_id", Integer, primary_key=True),
+                       Column("number", String))
+    src_phones.create(src_engine)
+    with src_engine.begin() as conn:
+        conn.execute(insert(src_phones), [{"customer_id": 99, "number": "x"}])
+    executor.run()
+    assert executor._copied_tables == ["phones"]
+    assert executor._split_targets == {"customers", "phones"}
+
+
+def test_insert_method_falls_back_for_unsupported_targets():  # noqa: D401
+    from sqlalchemy import JSON, LargeBinary
+    from sqlalchemy.types import NullType
+
+    pg = create_engine("postgresql+psycopg2://u:p@localhost/db")  # never connects
+    meta = MetaData()
+    plain = Table("plain", meta, Column("id", Integer, primary_key=True), Column("name", String))
+    blobs = Table("blobs", meta, Column("id", Integer, primary_key=True), Column("data", LargeBinary))
+    docs = Table("docs", meta, Column("id", Integer, primary_key=True), Column("doc", JSON))
+    shapes = Table("shapes", meta, Column("id", Integer, primary_key=True), Column("geom", NullType))
+
+    def method(insert_method, tbl, engine=pg):
+        return _executor(engine, engine, meta, meta, insert_method=insert_method)._insert_method(tbl)
+
+    assert method("copy", plain) == "copy"
+    assert method("values", plain) == "values"
+    assert method("copy", plain, create_engine("sqlite://")) == "executemany"
+    assert method("copy", blobs) == "executemany"
+    assert method("values", blobs) == "values"
+    assert method("values", docs) == method("copy", docs) == "executemany"
+    assert method("values", shapes) == "executemany"
+    assert method("executemany", plain) == "executemany"
+
+
+def test_csv_buffer_keeps_null_distinct_from_empty_string():  # noqa: D401
+    buf = _csv_buffer([[1, None, ""], [2, 'a,"b"', 1.5]])
+    assert buf.read() == '"1",,""\r\n"2","a,""b""","1.5"\r\n'
@@ -0,0 +1,69 @@
+"""Tests for :mod:`migradb_gui.schema` against a file-backed SQLite database."""
+from __future__ import annotations
+
+from sqlalchemy import create_engine, text
+
+import migradb_gui.schema as schema_mod
+from migradb_gui.schema import ColumnInfo, SchemaInspector, TableInfo
+
+
+def _make_db(tmp_path) -> str:
+    url = f"sqlite:///{tmp_path / 'schema.db'}"
+    engine = create_engine(url, future=True)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)"))
+        conn.execute(text("CREATE TABLE logs (msg TEXT, user_id INTEGER)"))
+        conn.execute(text("CREATE TABLE roles (user_id INTEGER, role TEXT, note TEXT, PRIMARY KEY (user_id, role))"))
+        conn.execute(text("CREATE VIEW v_users AS SELECT * FROM users"))
+    engine.dispose()
+    return url
+
+
+def test_list_tables_reflects_columns_and_pks(tmp_path):  # noqa: D401
+    tables = SchemaInspector(_make_db(tmp_path)).list_tables()
+    assert [t.name for t in tables] == ["logs", "roles", "users"]
+    logs, roles, users = tables
+    assert [c.name for c in users.columns] == ["id", "name"]
+    assert [c.name for c in users.primary_keys] == ["id"]
+    assert [c.name for c in logs.columns] == ["msg", "user_id"]
+    assert logs.primary_keys == ()
+    assert [c.name for c in roles.primary_keys] == ["user_id", "role"]
+
+
+def test_list_tables_cached_until_invalidate(tmp_path):  # noqa: D401
+    url = _make_db(tmp_path)
+    assert len(SchemaInspector(url).list_tables()) == 3
+    engine = create_engine(url, future=True)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE extra (id INTEGER PRIMARY KEY)"))
+    engine.dispose()
+    assert len(SchemaInspector(url).list_tables()) == 3
+    SchemaInspector.invalidate(url)
+    assert [t.name for t in SchemaInspector(url).list_tables()] == ["extra", "logs", "roles", "users"]
+
+
+def test_construction_does_not_connect(tmp_path):  # noqa: D401
+    url = f"sqlite:///{tmp_path / 'missing' / 'nope.db'}"
+    insp = SchemaInspector(url)  # would fail if it opened the file
+    assert insp._engine.pool.checkedout() == 0
+
+
+def test_disk_cache_requires_matching_signature(tmp_path, monkeypatch):  # noqa: D401
+    monkeypatch.setattr(schema_mod, "_DISK_CACHE_DIR", tmp_path / "cache")
+    insp = SchemaInspector(_make_db(tmp_path))
+    tables = insp._reflect_tables()
+    insp._save_disk_cache((1, 2), tables)
+    assert insp._load_disk_cache((1, 2)) == tables
+    assert insp._load_disk_cache((1, 3)) is None
+    SchemaInspector.invalidate(insp._url)
+    assert insp._load_disk_cache((1, 2)) is None
+
+
+def test_pk_bitmasks_and_uuid_detection():  # noqa: D401
+    src = TableInfo("t", [ColumnInfo("name", "TEXT", False), ColumnInfo("id", "INTEGER", True)])
+    tgt = TableInfo("t", [ColumnInfo("id", "UUID", True), ColumnInfo("name", "TEXT", False)])
+    assert (src.pk_bits, src.intpk_bits, src.uuidpk_bits) == (0b10, 0b10, 0)
+    assert (tgt.pk_bits, tgt.intpk_bits, tgt.uuidpk_bits) == (0b01, 0, 0b01)
+    assert src.has_incremental_pk() and not src.has_uuid_pk()
+    assert tgt.has_uuid_pk() and not tgt.has_incremental_pk()
+    assert not TableInfo("e", []).has_incremental_pk()
@@ -0,0 +1,26 @@
+"""Tests for :mod:`migradb_gui.storage`."""
+from __future__ import annotations
+
+from migradb_gui import storage
+from migradb_gui.connection import ConnectionPair, PgConnection
+
+
+def _pair() -> ConnectionPair:
+    return ConnectionPair(
+        PgConnection(host="h", database="src", user="u", password="p"),
+        PgConnection(host="h", database="tgt", user="u", password="p"),
+    )
+
+
+def test_saved_mappings_are_isolated_from_caller_edits(tmp_path, monkeypatch):  # noqa: D401
+    monkeypatch.setattr(storage, "_MAP_FILE", tmp_path / "mappings.json")
+    monkeypatch.setattr(storage, "_CACHE", {"mtime": None, "data": None})
+    maps = {"users": {"name": "full_name"}}
+    storage.save_mappings(_pair(), maps)
+    maps["users"]["email"] = "mail"
+    maps["orders"] = {}
+    assert storage.load_mappings(_pair()) == {"users": {"name": "full_name"}}
+
+    loaded = storage.load_mappings(_pair())
+    loaded["users"]["name"] = "changed"
+    assert storage.load_mappings(_pair()) == {"users": {"name": "full_name"}}
@@ -0,0 +1,94 @@
+"""Tests for :mod:`migradb_gui.validator`."""
+from __future__ import annotations
+
+from sqlalchemy import Column, ForeignKey, Integer, MetaData, String, Table, create_engine, event, insert
+from sqlalchemy.orm import Session
+
+from migradb_gui.validator import _ColumnDigest, column_checksums, compare_constraints
+
+
+def _session_with(rows) -> tuple[Session, Table]:
+    engine = create_engine("sqlite://", future=True)
+    meta = MetaData()
+    tbl = Table("t", meta, Column("id", Integer, primary_key=True), Column("name", String))
+    meta.create_all(engine)
+    sess = Session(engine)
+    if rows:
+        sess.execute(insert(tbl), rows)
+    return sess, tbl
+
+
+def test_column_checksums_match_for_equal_data():  # noqa: D401
+    rows = [{"id": i, "name": None if i % 5 == 0 else f"n{i}"} for i in range(1, 2501)]
+    a, tbl = _session_with(rows)
+    b, _ = _session_with(list(reversed(rows)))
+    assert column_checksums(a, tbl, batch_size=1000) == column_checksums(b, tbl, batch_size=1000)
+
+
+def test_column_checksums_detect_changed_column():  # noqa: D401
+    rows = [{"id": i, "name": f"n{i}"} for i in range(1, 50)]
+    a, tbl = _session_with(rows)
+    rows[10] = {"id": 11, "name": "changed"}
+    b, _ = _session_with(rows)
+    ca, cb = column_checksums(a, tbl, batch_size=7), column_checksums(b, tbl, batch_size=7)
+    assert ca["id"] == cb["id"]
+    assert ca["name"] != cb["name"]
+
+
+def test_column_checksums_independent_of_batch_size():  # noqa: D401
+    sess, tbl = _session_with([{"id": i, "name": f"n{i}"} for i in range(1, 100)])
+    assert column_checksums(sess, tbl, batch_size=7) == column_checksums(sess, tbl, batch_size=1000)
+
+
+def test_compare_constraints_reports_differences():  # noqa: D401
+    src_meta, tgt_meta = MetaData(), MetaData()
+    for meta in (src_meta, tgt_meta):
+        Table("users", meta, Column("id", Integer, primary_key=True))
+    src = Table("orders", src_meta, Column("id", Integer, primary_key=True),
+                Column("user_id", ForeignKey("users.id"), nullable=False))
+    tgt = Table("orders", tgt_meta, Column("id", Integer, primary_key=True), Column("user_id", Integer))
+    assert compare_constraints(src, src) == []
+    assert compare_constraints(src, tgt) == [
+        "NOT NULL columns differ: src={'user_id'}",
+        "Missing FKs in target: {'users'}",
+    ]
+
+
+def test_column_digest_is_batching_independent_and_unambiguous():  # noqa: D401
+    values = [None, "a", "b\x1fc", "\\x1f", 7, 2**70, -1, 1.5, True, b"x"] * 30
+
+    def digest(batch):
+        d = _ColumnDigest()
+        for i in range(0, len(values), batch):
+            d.update(tuple(values[i:i + batch]))
+        return d.hexdigest()
+
+    assert len({digest(b) for b in (1, 3, 7, 64, len(values))}) == 1
+
+    def one(*vals):
+        d = _ColumnDigest()
+        d.update(vals)
+        return d.hexdigest()
+
+    assert one("a\x1fb", "c") != one("a", "b\x1fc")
+    assert one("ab", "c") != one("a", "bc")
+    assert one(b"ab", b"c") != one(b"a", b"bc")
+    assert one(None) != one("None")
+    assert one(1) != one(True) != one(1.0)
+    assert one(1, 2**70) != one(2**70, 1)
+    assert one(2**70) != one(str(2**70)) != one(1 << 70 | 1)
+    assert one(-(2**63)) != one(-(2**63) - 1)
+    assert one(1.5, None) != one(None, 1.5)
+    assert one(b"x") != one("x") != one("b'x'")
+
+
+def test_column_checksums_order_by_every_pk_column():  # noqa: D401
+    engine = create_engine("sqlite://", future=True)
+    meta = MetaData()
+    tbl = Table("t", meta, Column("a", Integer, primary_key=True), Column("b", Integer, primary_key=True),
+                Column("v", String))
+    meta.create_all(engine)
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda conn, cur, stmt, *_: statements.append(stmt))
+    column_checksums(Session(engine), tbl)
+    assert statements[-1].endswith("ORDER BY t.a, t.b")